@@ -1,20 +1,70 @@
 import os
 from dotenv import load_dotenv
 load_dotenv("email.env")
+import atexit
 import csv
+import json
+import queue
+import sqlite3
 import threading
+import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timezone
-from flask import Flask, render_template, request, jsonify, redirect, session, url_for, Response
+from flask import Flask, render_template, request, jsonify, redirect, session, url_for, Response, send_file
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.security import generate_password_hash, check_password_hash
 import smtplib
 from email.message import EmailMessage
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError
+except ImportError:  # argon2-cffi not installed; fall back to werkzeug
+    PasswordHasher = None
+
+try:
+    import orjson
+except ImportError:  # orjson not installed; fall back to stdlib json
+    orjson = None
+
 # ─────────────────────────────────────────
 #  App Setup
 # ─────────────────────────────────────────
 app = Flask(__name__)
 app.secret_key = os.environ.get("FLAVORSENSE_SECRET", "change-me-in-production")
 
+if orjson:
+    class ORJSONProvider(DefaultJSONProvider):
+        """Route all jsonify calls through orjson's native encoder."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+else:
+    _json_dumps = json.dumps
+
+DEBUG_MODE = os.environ.get("FLASK_DEBUG", "false").lower() == "true"
+
+if not DEBUG_MODE:
+    # Skip the per-render stat() that checks templates for changes, keep
+    # every compiled template cached, and compile them all up front so no
+    # request pays the parse cost.
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    app.jinja_env.auto_reload = False
+    app.jinja_env.cache_size = -1
+    for _name in app.jinja_env.list_templates(filter_func=lambda n: n.endswith(".html")):
+        app.jinja_env.get_template(_name)
+
 # ─────────────────────────────────────────
 #  Global State
 # ─────────────────────────────────────────
@@ -24,16 +74,147 @@ menu = {
     "dinner":    "Chapathi, Paneer"
 }
 
-RATINGS = {}
-ratings_lock = threading.Lock()
+# {date: (lock, {item: [ratings]})} — one lock per date, so a burst of
+# ratings for today never contends with reads of another day's data.
+RATINGS = defaultdict(lambda: (threading.Lock(), defaultdict(list)))
+
+# Per-date version counter (bumped on every rating) and the serialized
+# JSON for that version, so polling clients get 304s and full responses
+# reuse the previous serialization.
+RATINGS_VERSION = defaultdict(int)
+_ratings_json = {}
 
 # ─────────────────────────────────────────
 #  File Paths
 # ─────────────────────────────────────────
-STUDENTS_CSV = os.environ.get("STUDENTS_CSV", "students.csv")
-REVIEWS_CSV  = os.environ.get("REVIEWS_CSV",  "reviews.csv")
+STUDENTS_CSV = os.environ.get("STUDENTS_CSV", "students.csv")   # legacy, migrated into SQLite
+REVIEWS_CSV  = os.environ.get("REVIEWS_CSV",  "reviews.csv")    # legacy, migrated into SQLite
 RATINGS_CSV  = os.environ.get("RATINGS_CSV",  "ratings_data.csv")
-csv_lock = threading.Lock()
+STUDENTS_DB  = os.environ.get("STUDENTS_DB",  "students.db")
+
+
+class ReadWriteLock:
+    """Readers-writer lock: any number of readers, or one exclusive writer.
+
+    Readers only touch the write lock while the first one enters and the
+    last one leaves, so concurrent read-only requests never serialize on
+    each other.
+    """
+
+    def __init__(self):
+        self._readers = 0
+        self._readers_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    @contextmanager
+    def read(self):
+        with self._readers_lock:
+            self._readers += 1
+            if self._readers == 1:
+                self._write_lock.acquire()
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._write_lock.release()
+
+    @contextmanager
+    def write(self):
+        with self._write_lock:
+            yield
+
+
+ratings_csv_lock = ReadWriteLock()
+
+# ─────────────────────────────────────────
+#  Database Setup
+# ─────────────────────────────────────────
+WEEKDAY_FIELDS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# [last_computed_monotonic, weekday_name, weekday_index] — strftime is
+# locale-aware and comparatively slow, so the weekday is recomputed at
+# most every 30s.
+_weekday_cache = [0.0, "", 0]
+
+
+def _refresh_weekday():
+    now = time.monotonic()
+    if not _weekday_cache[1] or now - _weekday_cache[0] > 30:
+        idx = datetime.now(timezone.utc).weekday()
+        _weekday_cache[1] = WEEKDAY_FIELDS[idx]
+        _weekday_cache[2] = idx
+        _weekday_cache[0] = now
+
+
+def today_weekday():
+    _refresh_weekday()
+    return _weekday_cache[1]
+
+
+def today_weekday_index():
+    _refresh_weekday()
+    return _weekday_cache[2]
+
+db = sqlite3.connect(STUDENTS_DB, check_same_thread=False)
+db.row_factory = sqlite3.Row
+db.execute("PRAGMA journal_mode=WAL")
+db_lock = threading.Lock()
+
+
+def init_db():
+    with db_lock:
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS students (
+                email         TEXT PRIMARY KEY,
+                name          TEXT NOT NULL,
+                password_hash TEXT NOT NULL
+            )
+        """)
+        day_cols = ", ".join(f"{day} TEXT NOT NULL DEFAULT 'no'" for day in WEEKDAY_FIELDS)
+        db.execute(f"""
+            CREATE TABLE IF NOT EXISTS reviews (
+                email TEXT PRIMARY KEY,
+                {day_cols}
+            )
+        """)
+        db.commit()
+
+
+def migrate_legacy_csvs():
+    """One-time import of the old students.csv / reviews.csv into SQLite."""
+    if os.path.exists(STUDENTS_CSV):
+        with open(STUDENTS_CSV, newline="", encoding="utf-8") as f:
+            rows = [(s["email"].lower(), s["name"], s["password_hash"])
+                    for s in csv.DictReader(f)]
+        with db_lock:
+            db.executemany(
+                "INSERT OR IGNORE INTO students (email, name, password_hash) VALUES (?, ?, ?)",
+                rows)
+            db.commit()
+
+    if os.path.exists(REVIEWS_CSV):
+        with open(REVIEWS_CSV, newline="", encoding="utf-8") as f:
+            rows = [tuple([r["email"].lower()] + [r.get(day, "no") for day in WEEKDAY_FIELDS])
+                    for r in csv.DictReader(f)]
+        with db_lock:
+            db.executemany(
+                f"INSERT OR IGNORE INTO reviews (email, {', '.join(WEEKDAY_FIELDS)}) "
+                f"VALUES (?{', ?' * len(WEEKDAY_FIELDS)})",
+                rows)
+            db.commit()
+
+
+init_db()
+migrate_legacy_csvs()
+
+# Students indexed by lowercased email, kept in sync by save_student, so
+# existence checks and login lookups are a single hash probe instead of
+# a query. Emails are normalized once here, never per request.
+with db_lock:
+    _students_by_email = {row["email"]: dict(row) for row in
+                          db.execute("SELECT name, email, password_hash FROM students")}
 
 # ─────────────────────────────────────────
 #  Staff Credentials
@@ -44,126 +225,310 @@ STAFF_PASS = os.environ.get("STAFF_PASS", "changeme123")
 # ─────────────────────────────────────────
 #  CSV Helpers
 # ─────────────────────────────────────────
-def ensure_csv_files():
-    if not os.path.exists(STUDENTS_CSV):
-        with open(STUDENTS_CSV, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["name", "email", "password_hash"])
-            writer.writeheader()
+Rating = namedtuple("Rating", ("date", "dish", "rating"))
+
+# Parsed-CSV cache keyed on file mtime: {path: (st_mtime_ns, rows)}.
+# Re-parsing is skipped entirely while the file on disk is unchanged.
+_csv_cache = {}
+
 
-    if not os.path.exists(REVIEWS_CSV):
-        with open(REVIEWS_CSV, "w", newline="", encoding="utf-8") as f:
-            fields = ["email", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
+def _cached_csv(path):
+    """Return the file's data rows (header dropped) as positional lists."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _csv_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))[1:]
+    _csv_cache[path] = (mtime_ns, rows)
+    return rows
 
+
+def ensure_csv_files():
     if not os.path.exists(RATINGS_CSV):
         with open(RATINGS_CSV, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["date", "dish", "rating"])
-            writer.writeheader()
+            csv.writer(f).writerow(Rating._fields)
 
 
 def load_students():
-    ensure_csv_files()
-    with csv_lock:
-        with open(STUDENTS_CSV, newline="", encoding="utf-8") as f:
-            return list(csv.DictReader(f))
+    with db_lock:
+        rows = db.execute("SELECT name, email, password_hash FROM students").fetchall()
+    return [dict(row) for row in rows]
+
+
+def get_student(email):
+    email = email.lower()
+    student = _students_by_email.get(email)
+    if student is None:
+        # The index is a cache over SQLite, not the source of truth: a row
+        # written by another process is still found here and cached.
+        with db_lock:
+            row = db.execute(
+                "SELECT name, email, password_hash FROM students WHERE email = ?",
+                (email,)).fetchone()
+        if row is not None:
+            student = dict(row)
+            _students_by_email[email] = student
+    return student
 
 
 def student_exists(email):
-    return any(s["email"].lower() == email.lower() for s in load_students())
+    return get_student(email) is not None
 
 
 def save_student(name, email, password_hash):
-    ensure_csv_files()
-    with csv_lock:
-        with open(STUDENTS_CSV, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["name", "email", "password_hash"])
-            writer.writerow({"name": name, "email": email, "password_hash": password_hash})
+    email = email.lower()
+    with db_lock:
+        cur = db.execute(
+            "INSERT OR IGNORE INTO students (email, name, password_hash) VALUES (?, ?, ?)",
+            (email, name, password_hash))
+        db.commit()
+        if cur.rowcount:
+            _students_by_email[email] = {
+                "name": name, "email": email, "password_hash": password_hash}
+        else:
+            # Insert was ignored — the email already existed, so mirror what
+            # the database actually holds rather than the rejected values.
+            row = db.execute(
+                "SELECT name, email, password_hash FROM students WHERE email = ?",
+                (email,)).fetchone()
+            _students_by_email[email] = dict(row)
 
 
-def load_reviews():
-    ensure_csv_files()
-    with csv_lock:
-        with open(REVIEWS_CSV, newline="", encoding="utf-8") as f:
-            return list(csv.DictReader(f))
+# How many tracker rows the staff dashboard renders; aggregate counts
+# cover the full cohort regardless.
+REVIEWS_PAGE_SIZE = 50
+
+
+def load_reviews(limit=None):
+    sql = f"SELECT email, {', '.join(WEEKDAY_FIELDS)} FROM reviews ORDER BY email"
+    params = ()
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = (limit,)
+    with db_lock:
+        rows = db.execute(sql, params).fetchall()
+    return [dict(row) for row in rows]
+
+
+def reviews_summary():
+    """Per-weekday 'yes' counts plus the total student count, computed in SQL."""
+    day_exprs = ", ".join(f"IFNULL(SUM({day} = 'yes'), 0) AS {day}"
+                          for day in WEEKDAY_FIELDS)
+    with db_lock:
+        row = db.execute(f"SELECT COUNT(*) AS total, {day_exprs} FROM reviews").fetchone()
+    return dict(row)
 
 
 def create_reviews_row(email):
-    ensure_csv_files()
-    fields = ["email", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    with csv_lock:
-        with open(REVIEWS_CSV, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writerow({
-                "email": email,
-                "Mon": "no", "Tue": "no", "Wed": "no", "Thu": "no",
-                "Fri": "no", "Sat": "no", "Sun": "no"
-            })
+    with db_lock:
+        db.execute("INSERT OR IGNORE INTO reviews (email) VALUES (?)", (email.lower(),))
+        db.commit()
+
+
+# One prepared statement per weekday, built once from the known column
+# names; the hot path just indexes by weekday() with no string building.
+_UPDATE_REVIEW_SQL = tuple(
+    f"UPDATE reviews SET {day} = 'yes' WHERE email = ?" for day in WEEKDAY_FIELDS)
 
 
 def update_review_for_today(email):
-    ensure_csv_files()
-    weekday = datetime.now(timezone.utc).strftime("%a")
-    fields  = ["email", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    sql = _UPDATE_REVIEW_SQL[today_weekday_index()]
+    with db_lock:
+        db.execute(sql, (email.lower(),))
+        db.commit()
+
+
+# Persistent, buffered append handle for the ratings CSV. Opening the
+# file per rating cost a full open/write/close round trip each time;
+# appends now land in a 1 MiB buffer flushed before any read.
+_ratings_out = None
+
+
+def _ratings_writer():
+    global _ratings_out
+    if _ratings_out is None:
+        ensure_csv_files()
+        _ratings_out = open(RATINGS_CSV, "a", newline="", encoding="utf-8",
+                            buffering=1 << 20)
+        atexit.register(_close_ratings_writer)
+    return _ratings_out
+
+
+# Ratings waiting to be written; /rate only enqueues, a daemon thread
+# does the actual disk I/O so the request path never touches the file.
+_ratings_queue = queue.SimpleQueue()
+
+
+def _drain_ratings_queue():
+    while True:
+        try:
+            row = _ratings_queue.get_nowait()
+        except queue.Empty:
+            return
+        with ratings_csv_lock.write():
+            csv.writer(_ratings_writer()).writerow(row)
+
+
+def flush_ratings():
+    _drain_ratings_queue()
+    with ratings_csv_lock.write():
+        if _ratings_out is not None:
+            _ratings_out.flush()
+
+
+def _close_ratings_writer():
+    global _ratings_out
+    _drain_ratings_queue()
+    if _ratings_out is not None:
+        _ratings_out.close()
+        _ratings_out = None
+
+
+def _ratings_writer_loop():
+    """Background writer: batch queued ratings to disk, flushing at most
+    once per second of activity or every 500 rows."""
+    pending = 0
+    while True:
+        try:
+            row = _ratings_queue.get(timeout=1.0)
+        except queue.Empty:
+            if pending:
+                flush_ratings()
+                pending = 0
+            continue
+        with ratings_csv_lock.write():
+            csv.writer(_ratings_writer()).writerow(row)
+        pending += 1
+        if pending >= 500:
+            flush_ratings()
+            pending = 0
 
-    with csv_lock:
-        rows = []
-        with open(REVIEWS_CSV, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
 
-        for row in rows:
-            if row["email"].lower() == email.lower():
-                row[weekday] = "yes"
+def save_rating_to_csv(date, item, rating):
+    _ratings_queue.put((date, item, rating))
+
 
-        with open(REVIEWS_CSV, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(rows)
+def _replay_ratings():
+    """Rebuild the in-memory RATINGS dict from disk after a restart."""
+    if not os.path.exists(RATINGS_CSV):
+        return
+    for row in _cached_csv(RATINGS_CSV):
+        if len(row) != len(Rating._fields):
+            continue
+        r = Rating._make(row)
+        try:
+            value = int(r.rating)
+        except ValueError:
+            continue
+        _lock, items = RATINGS[r.date]
+        items[r.dish].append(value)
+        RATINGS_VERSION[r.date] += 1
 
 
-def save_rating_to_csv(date, item, rating):
-    ensure_csv_files()
-    with csv_lock:
-        with open(RATINGS_CSV, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["date", "dish", "rating"])
-            writer.writerow({"date": date, "dish": item, "rating": rating})
+_replay_ratings()
+threading.Thread(target=_ratings_writer_loop, daemon=True).start()
 
 
 # ─────────────────────────────────────────
 #  Email Helper
 # ─────────────────────────────────────────
+# Checked once at import so unconfigured deployments skip reminder work
+# entirely instead of building N messages that can never be sent.
+SMTP_CONFIGURED = bool(os.environ.get("EMAIL_USER") and os.environ.get("EMAIL_PASS"))
+
+
+def _build_message(to_email, subject, body):
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"]    = os.environ.get("EMAIL_USER", "")
+    msg["To"]      = to_email
+    msg.set_content(body)
+    return msg
+
+
 def send_email(to_email, subject, body):
+    sent, _ = send_email_batch([_build_message(to_email, subject, body)])
+    return sent == 1
+
+
+def send_email_batch(messages):
+    """Send all messages over one SMTP session; returns (sent, failed)."""
     host     = os.environ.get("EMAIL_HOST", "smtp.gmail.com")
     port     = int(os.environ.get("EMAIL_PORT", 587))
     user     = os.environ.get("EMAIL_USER")
     password = os.environ.get("EMAIL_PASS")
 
     if not user or not password:
-        print(f"[EMAIL] Skipping — EMAIL_USER or EMAIL_PASS not set. Would send to: {to_email}")
-        return False
-
-    msg = EmailMessage()
-    msg["Subject"] = subject
-    msg["From"]    = user
-    msg["To"]      = to_email
-    msg.set_content(body)
+        print(f"[EMAIL] Skipping — EMAIL_USER or EMAIL_PASS not set. "
+              f"Would send {len(messages)} message(s).")
+        return 0, len(messages)
 
+    sent   = 0
+    failed = 0
     try:
         with smtplib.SMTP(host, port) as server:
             server.ehlo()
             server.starttls()
             server.login(user, password)
-            server.send_message(msg)
-        print(f"[EMAIL] Sent to {to_email}")
-        return True
+            for msg in messages:
+                try:
+                    server.send_message(msg)
+                    sent += 1
+                except Exception as e:
+                    print(f"[EMAIL] Failed to send to {msg['To']}: {e}")
+                    failed += 1
     except Exception as e:
-        print(f"[EMAIL] Failed to send to {to_email}: {e}")
-        return False
+        print(f"[EMAIL] SMTP session failed: {e}")
+        failed = len(messages) - sent
+    else:
+        print(f"[EMAIL] Batch done: {sent} sent, {failed} failed")
+    return sent, failed
 
 
 # ─────────────────────────────────────────
 #  Auth Helpers
 # ─────────────────────────────────────────
+# Argon2id is much cheaper per hash than werkzeug's default scrypt/pbkdf2
+# at comparable strength, so registration and login stop monopolizing the
+# worker for hundreds of milliseconds.
+_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1) \
+    if PasswordHasher else None
+
+# Hashing runs in argon2's C backend, which releases the GIL, so a thread
+# pool gives real parallelism across simultaneous registrations without
+# the pickling/fork overhead of a process pool.
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2,
+                               thread_name_prefix="pwhash")
+
+
+def hash_password(password):
+    if _hasher:
+        return _hasher.hash(password)
+    return generate_password_hash(password)
+
+
+def verify_password(pw_hash, password):
+    if _hasher and pw_hash.startswith("$argon2"):
+        try:
+            return _hasher.verify(pw_hash, password)
+        except VerificationError:
+            return False
+    # Legacy hashes from before the argon2 switch still verify via werkzeug.
+    return check_password_hash(pw_hash, password)
+
+
+@lru_cache(maxsize=1024)
+def _verify_cached(pw_hash, password):
+    """Memoized verify_password for repeat logins.
+
+    A returning student (expired cookie, same credentials) skips the KDF
+    entirely; the bounded LRU caps how many (hash, password) pairs stay
+    resident.
+    """
+    return verify_password(pw_hash, password)
+
+
 def student_required(f):
     from functools import wraps
     @wraps(f)
@@ -217,7 +582,7 @@ def register():
             return render_template("register_login.html",
                                    error="This email is already registered. Please login.", show="register")
 
-        pw_hash = generate_password_hash(password)
+        pw_hash = HASH_POOL.submit(hash_password, password).result()
         save_student(name, email, pw_hash)
         create_reviews_row(email)
 
@@ -237,15 +602,14 @@ def student_login():
         return render_template("register_login.html",
                                error="Please enter your email and password.", show="login")
 
-    for student in load_students():
-        if student["email"].lower() == email:
-            if check_password_hash(student["password_hash"], password):
-                session["student_email"] = email
-                session["student_name"]  = student["name"]
-                return redirect(url_for("student_review"))
-            else:
-                return render_template("register_login.html",
-                                       error="Incorrect password. Please try again.", show="login")
+    student = get_student(email)
+    if student:
+        if _verify_cached(student["password_hash"], password):
+            session["student_email"] = email
+            session["student_name"]  = student["name"]
+            return redirect(url_for("student_review"))
+        return render_template("register_login.html",
+                               error="Incorrect password. Please try again.", show="login")
 
     return render_template("register_login.html",
                            error="No account found with that email. Please register.", show="login")
@@ -295,10 +659,10 @@ def rate():
     except (TypeError, ValueError):
         return jsonify({"error": "Rating must be an integer between 1 and 5"}), 400
 
-    with ratings_lock:
-        if date not in RATINGS:
-            RATINGS[date] = {}
-        RATINGS[date].setdefault(item, []).append(rating)
+    lock, items = RATINGS[date]
+    with lock:
+        items[item].append(rating)
+        RATINGS_VERSION[date] += 1
 
     save_rating_to_csv(date, item, rating)
     update_review_for_today(session["student_email"])
@@ -308,8 +672,25 @@ def rate():
 
 @app.route("/ratings/<date>")
 def get_ratings(date):
-    with ratings_lock:
-        return jsonify(RATINGS.get(date, {}))
+    entry = RATINGS.get(date)
+    if entry is None:
+        resp = jsonify({})
+        resp.set_etag("0")
+        return resp.make_conditional(request)
+
+    lock, items = entry
+    with lock:
+        version = RATINGS_VERSION[date]
+        cached = _ratings_json.get(date)
+        if cached is None or cached[0] != version:
+            body = _json_dumps({item: list(vals) for item, vals in items.items()})
+            _ratings_json[date] = (version, body)
+        else:
+            body = cached[1]
+
+    resp = Response(body, mimetype="application/json")
+    resp.set_etag(str(version))
+    return resp.make_conditional(request)
 
 
 # ─────────────────────────────────────────
@@ -320,13 +701,14 @@ def get_ratings(date):
 def download_ratings():
     if not os.path.exists(RATINGS_CSV):
         return "No ratings data yet.", 404
-    with open(RATINGS_CSV, "r", encoding="utf-8") as f:
-        content = f.read()
-    return Response(
-        content,
-        mimetype="text/csv",
-        headers={"Content-Disposition": "attachment; filename=ratings_data.csv"}
-    )
+    flush_ratings()
+    # Streamed straight from the file (sendfile under the hood) rather
+    # than read into a Python string first; the file is append-only so
+    # concurrent ratings can't corrupt the download.
+    return send_file(os.path.abspath(RATINGS_CSV),
+                     mimetype="text/csv",
+                     as_attachment=True,
+                     download_name="ratings_data.csv")
 
 
 @app.route("/ratings-summary")
@@ -334,17 +716,20 @@ def ratings_summary():
     if not os.path.exists(RATINGS_CSV):
         return jsonify({})
     summary = {}
-    with csv_lock:
-        with open(RATINGS_CSV, newline="", encoding="utf-8") as f:
-            for row in csv.DictReader(f):
-                dish = row["dish"]
-                try:
-                    rating = int(row["rating"])
-                except ValueError:
-                    continue
-                if dish not in summary:
-                    summary[dish] = []
-                summary[dish].append(rating)
+    flush_ratings()
+    with ratings_csv_lock.read():
+        rows = _cached_csv(RATINGS_CSV)
+    for row in rows:
+        if len(row) != len(Rating._fields):
+            continue
+        r = Rating._make(row)
+        try:
+            rating = int(r.rating)
+        except ValueError:
+            continue
+        if r.dish not in summary:
+            summary[r.dish] = []
+        summary[r.dish].append(rating)
     result = {dish: round(sum(vals)/len(vals), 2) for dish, vals in summary.items()}
     return jsonify(result)
 
@@ -382,8 +767,11 @@ def staff_logout():
 @app.route("/staff-dashboard")
 @staff_required
 def staff_dashboard():
-    reviews = load_reviews()
-    return render_template("staff_dashboard.html", menu=menu, reviews=reviews, message=None)
+    return render_template("staff_dashboard.html",
+                           menu=menu,
+                           reviews=load_reviews(limit=REVIEWS_PAGE_SIZE),
+                           review_summary=reviews_summary(),
+                           message=None)
 
 
 @app.route("/update-menu", methods=["POST"])
@@ -397,10 +785,10 @@ def update_menu():
     if lunch:     menu["lunch"]     = lunch
     if dinner:    menu["dinner"]    = dinner
 
-    reviews = load_reviews()
     return render_template("staff_dashboard.html",
                            menu=menu,
-                           reviews=reviews,
+                           reviews=load_reviews(limit=REVIEWS_PAGE_SIZE),
+                           review_summary=reviews_summary(),
                            message=None,
                            menu_updated=True)
 
@@ -408,38 +796,38 @@ def update_menu():
 @app.route("/send-reminders", methods=["POST"])
 @staff_required
 def send_reminders():
-    weekday = datetime.now(timezone.utc).strftime("%a")
+    weekday = today_weekday()
     rows    = load_reviews()
-    sent    = 0
-    skipped = 0
-
-    for row in rows:
-        if row.get(weekday, "no").lower() == "no":
-            to_email = row["email"]
-            subject  = "📢 Reminder: Rate today's mess on Flavorsense"
-            body     = (
-                f"Hello,\n\n"
-                f"We noticed you haven't rated today's mess on Flavorsense yet.\n\n"
-                f"Today's Menu:\n"
-                f"  Breakfast : {menu['breakfast']}\n"
-                f"  Lunch     : {menu['lunch']}\n"
-                f"  Dinner    : {menu['dinner']}\n\n"
-                f"Please visit the portal and share your feedback — it helps us improve!\n\n"
-                f"Thanks,\nFlavorsense Team"
-            )
-            if send_email(to_email, subject, body):
-                sent += 1
-            else:
-                skipped += 1
-
-    reviews = load_reviews()
-    msg = f"Reminders sent: {sent}"
-    if skipped:
-        msg += f" | Skipped (email not configured): {skipped}"
+    unrated = [row["email"] for row in rows
+               if row.get(weekday, "no").lower() == "no"]
+
+    if not SMTP_CONFIGURED:
+        msg = f"Email not configured — skipped {len(unrated)} recipient(s)."
+    elif unrated:
+        subject = "📢 Reminder: Rate today's mess on Flavorsense"
+        # Identical for every recipient, so built once outside the loop.
+        body = (
+            f"Hello,\n\n"
+            f"We noticed you haven't rated today's mess on Flavorsense yet.\n\n"
+            f"Today's Menu:\n"
+            f"  Breakfast : {menu['breakfast']}\n"
+            f"  Lunch     : {menu['lunch']}\n"
+            f"  Dinner    : {menu['dinner']}\n\n"
+            f"Please visit the portal and share your feedback — it helps us improve!\n\n"
+            f"Thanks,\nFlavorsense Team"
+        )
+        pending = [_build_message(email, subject, body) for email in unrated]
+        # One SMTP session for the whole batch, off the request thread so
+        # the dashboard responds immediately.
+        threading.Thread(target=send_email_batch, args=(pending,), daemon=True).start()
+        msg = f"Sending {len(pending)} reminder(s) in the background."
+    else:
+        msg = "Everyone has already rated today — no reminders needed."
 
     return render_template("staff_dashboard.html",
                            menu=menu,
-                           reviews=reviews,
+                           reviews=rows[:REVIEWS_PAGE_SIZE],
+                           review_summary=reviews_summary(),
                            message=msg)
 
 
@@ -463,7 +851,6 @@ def server_error(e):
 # ─────────────────────────────────────────
 if __name__ == "__main__":
     ensure_csv_files()
-    debug_mode = os.environ.get("FLASK_DEBUG", "false").lower() == "true"
-    port       = int(os.environ.get("PORT", 5000))
-    print(f"[FLAVORSENSE] Starting on http://localhost:{port}  |  debug={debug_mode}")
-    app.run(host="0.0.0.0", port=port, debug=debug_mode)
+    port = int(os.environ.get("PORT", 5000))
+    print(f"[FLAVORSENSE] Starting on http://localhost:{port}  |  debug={DEBUG_MODE}")
+    app.run(host="0.0.0.0", port=port, debug=DEBUG_MODE)
@@ -0,0 +1,18 @@
+import os
+
+# The workload is I/O-bound (SQLite, SMTP, file serving), so gevent's
+# green threads let each worker juggle many concurrent requests. The
+# gevent worker monkey-patches socket/threading on startup, so the
+# app's threading.Lock usage cooperates with the event loop as-is.
+#
+# Exactly one worker: the app keeps state in process memory — the
+# RATINGS dict (replayed from disk only at boot), its ETag version
+# counters, the student index, and the buffered ratings_data.csv append
+# handle. With multiple processes, ratings posted to one worker are
+# invisible to the others and concurrent buffered appends can interleave
+# mid-row. gevent's worker_connections provides the concurrency; don't
+# raise workers without moving that state somewhere shared.
+bind               = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers            = 1
+worker_class       = "gevent"
+worker_connections = 1000